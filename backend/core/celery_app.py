@@ -1,11 +1,20 @@
 """
 Celery configuration for async video processing tasks.
 """
+import asyncio
 import logging
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Coroutine, Optional
 from celery import Celery
-from celery.signals import worker_ready, worker_shutting_down
+from celery.signals import worker_ready, worker_shutdown, worker_shutting_down
 from .config import settings
 
+try:
+    import uvloop
+except ImportError:  # uvloop is unavailable on Windows
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
 # Create Celery app
@@ -144,6 +153,70 @@ celery_app.conf.update(
 )
 
 
+# Event loop shared by async task bodies for the lifetime of the worker, so
+# database, Redis and FRED resources stay bound to a single loop
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_loop_lock = threading.Lock()
+
+
+def _run_worker_loop(loop: asyncio.AbstractEventLoop) -> None:
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
+
+
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared worker event loop, starting its thread on first use."""
+    global _worker_loop
+    with _worker_loop_lock:
+        if _worker_loop is None or _worker_loop.is_closed():
+            loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+            threading.Thread(
+                target=_run_worker_loop, args=(loop,), name="celery-event-loop", daemon=True
+            ).start()
+            _worker_loop = loop
+    return _worker_loop
+
+
+def run_async(coro: Coroutine[Any, Any, Any], timeout: Optional[float] = None) -> Any:
+    """
+    Run a coroutine on the shared worker event loop and wait for its result.
+    
+    Args:
+        coro: Coroutine to run
+        timeout: Seconds to wait, defaulting to the hard task time limit
+        
+    Returns:
+        The coroutine's result
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, _get_worker_loop())
+    try:
+        return future.result(settings.CELERY_TASK_TIME_LIMIT if timeout is None else timeout)
+    except FutureTimeoutError:
+        future.cancel()
+        raise
+
+
+def _shutdown_worker_loop() -> None:
+    """Release services bound to the shared worker loop and stop it, if it was started."""
+    global _worker_loop
+    with _worker_loop_lock:
+        loop, _worker_loop = _worker_loop, None
+    if loop is None or loop.is_closed():
+        return
+
+    # Economic tasks keep the FRED service open across runs; release it here
+    from services.fred_service import shutdown_fred_service
+    try:
+        asyncio.run_coroutine_threadsafe(shutdown_fred_service(), loop).result(timeout=30)
+    except Exception as e:
+        logger.error(f"Failed to close FRED service on worker shutdown: {e}")
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+
+
 @worker_ready.connect
 def worker_ready_handler(sender=None, **kwargs):
     """Handle worker ready event."""
@@ -156,6 +229,12 @@ def worker_shutting_down_handler(sender=None, **kwargs):
     logger.info(f"Celery worker {sender.hostname} is shutting down")
 
 
+@worker_shutdown.connect
+def worker_shutdown_handler(sender=None, **kwargs):
+    """Stop the shared event loop once the pool has finished running tasks."""
+    _shutdown_worker_loop()
+
+
 # Enhanced task state tracking with performance metrics
 TASK_STATES = {
     'PENDING': 'Task is waiting to be processed',
@@ -96,6 +96,11 @@ class Settings(BaseSettings):
         env="BUREAU_OF_STATISTIC_KEY",
         description="Bureau of Labor Statistics API key"
     )
+    FRED_MAX_CONCURRENCY: int = Field(
+        default=8,
+        env="FRED_MAX_CONCURRENCY",
+        description="Maximum concurrent FRED series updates per task"
+    )
     
     # YouTube processing settings
     MAX_VIDEO_DURATION_MINUTES: int = Field(
@@ -22,6 +22,7 @@ from sqlalchemy import text
 from core.config import settings
 from core.database import engine, create_db_and_tables
 from api.routes import videos, folders, prompts, economic_data, simple_youtube
+from services.fred_service import shutdown_fred_service
 from models.database import Base
 
 # Configure logging
@@ -103,6 +104,9 @@ async def shutdown_event():
     """Clean up resources on shutdown."""
     logger.info("Shutting down YouTube Video Insights API...")
     
+    # Release the shared FRED service used by the economic data routes
+    await shutdown_fred_service()
+    
     # Clean up temporary files
     import shutil
     if os.path.exists("temp"):
@@ -15,6 +15,7 @@ from dataclasses import dataclass
 from enum import Enum
 
 import aiohttp
+import orjson
 from aiohttp import ClientTimeout, ClientError
 
 from core.config import settings
@@ -240,7 +241,7 @@ class BLSService:
                     if isinstance(cached_response, bytes):
                         cached_response = cached_response.decode('utf-8')
                     cached_data = json.loads(cached_response)
-                    logger.debug(f"Cache hit for BLS endpoint: {endpoint}")
+                    logger.debug("Cache hit for BLS endpoint: %s", endpoint)
                     return cached_data
         except Exception as cache_error:
             logger.warning(f"Redis cache read failed: {cache_error}")
@@ -254,9 +255,10 @@ class BLSService:
         url = f"{self.base_url}/{endpoint}"
         
         try:
-            logger.debug(f"Making BLS API request: {endpoint} with data: {data}")
+            logger.debug("Making BLS API request: %s with data: %s", endpoint, data)
             
-            async with self.session.post(url, json=data) as response:
+            # Session headers already set Content-Type: application/json
+            async with self.session.post(url, data=orjson.dumps(data)) as response:
                 if response.status == 200:
                     response_data = await response.json()
                     
@@ -277,7 +279,7 @@ class BLSService:
                     except Exception as cache_error:
                         logger.warning(f"Redis cache write failed: {cache_error}")
                     
-                    logger.info(f"Successfully retrieved BLS data: {endpoint}")
+                    logger.info("Successfully retrieved BLS data: %s", endpoint)
                     return response_data
                 
                 elif response.status == 429:
@@ -7,18 +7,22 @@ and database integration for housing and labor market data.
 """
 
 import asyncio
+import functools
 import json
 import logging
 import hashlib
 import os
-from datetime import datetime, timedelta
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor
 
+import orjson
 import pandas as pd
 from fredapi import Fred
-from sqlalchemy import select, and_
+from sqlalchemy import select, insert, update, and_
 from core.database import async_session_maker
 from services.cache_service import cache_service
 
@@ -70,34 +74,31 @@ class FREDRateLimiter:
     def __init__(self, max_requests: int = 120, time_window: int = 3600):
         self.max_requests = max_requests
         self.time_window = time_window
-        self.requests = []
+        self.requests: deque = deque()
         self.lock = asyncio.Lock()
 
     async def acquire(self) -> None:
         """Acquire rate limit token."""
         async with self.lock:
-            now = datetime.utcnow()
-
-            # Remove old requests outside time window
-            cutoff = now - timedelta(seconds=self.time_window)
-            self.requests = [
-                req_time for req_time in self.requests if req_time > cutoff
-            ]
-
-            # Check if we can make request
-            if len(self.requests) >= self.max_requests:
-                # Calculate wait time
-                oldest_request = min(self.requests)
-                wait_until = oldest_request + timedelta(seconds=self.time_window)
-                wait_seconds = (wait_until - now).total_seconds()
-
-                if wait_seconds > 0:
-                    logger.warning(
-                        f"FRED API rate limit reached. Waiting {wait_seconds:.1f} seconds..."
-                    )
-                    await asyncio.sleep(wait_seconds)
-                    # Retry after waiting
-                    return await self.acquire()
+            while True:
+                now = time.monotonic()
+
+                # Remove old requests outside time window
+                cutoff = now - self.time_window
+                while self.requests and self.requests[0] <= cutoff:
+                    self.requests.popleft()
+
+                # Check if we can make request
+                if len(self.requests) < self.max_requests:
+                    break
+
+                # Wait for the oldest request to leave the window, then re-check.
+                # Sleeping while holding the lock keeps waiters queued in order.
+                wait_seconds = self.requests[0] + self.time_window - now
+                logger.warning(
+                    f"FRED API rate limit reached. Waiting {wait_seconds:.1f} seconds..."
+                )
+                await asyncio.sleep(wait_seconds)
 
             # Record this request
             self.requests.append(now)
@@ -137,9 +138,10 @@ class FREDService:
     def __init__(self):
         """Initialize FRED service with fredapi client and rate limiting."""
         self.api_key = self._get_api_key()
+        self._enabled = bool(self.api_key)
         self.fred_client: Optional[Fred] = None
         self.rate_limiter = FREDRateLimiter()
-        self.executor = ThreadPoolExecutor(max_workers=4)  # For async execution
+        self.executor: Optional[ThreadPoolExecutor] = None  # For async execution
 
         # Cache TTL settings
         self.DAILY_CACHE_TTL = 60 * 60 * 24      # 24 hours for daily data
@@ -147,6 +149,17 @@ class FREDService:
         self.MONTHLY_CACHE_TTL = 60 * 60 * 6     # 6 hours for monthly data
         self.METADATA_CACHE_TTL = 60 * 60 * 24 * 7  # 7 days for metadata
 
+        # Per-series TTL table; series not listed use the daily TTL
+        self._series_cache_ttls = {
+            # Weekly series get shorter cache
+            **dict.fromkeys(('ICSA', 'CCSA', 'IC4WSA'), self.WEEKLY_CACHE_TTL),
+            # Monthly series get medium cache
+            **dict.fromkeys(
+                ('HOUST', 'MSACSR', 'HSN1F', 'UNRATE', 'PAYEMS', 'CIVPART'),
+                self.MONTHLY_CACHE_TTL
+            ),
+        }
+
         # Error tracking
         self.error_count = 0
         self.last_error_time = None
@@ -159,20 +172,29 @@ class FREDService:
                 "FRED_API_KEY not found in environment variables. "
                 "Please set FRED_API_KEY in your .env file or system environment."
             )
-            raise ValueError("FRED_API_KEY environment variable is required")
+            return ""
         return api_key
 
     @property
     def is_enabled(self) -> bool:
         """Check if FRED service is enabled (has valid API key)."""
-        try:
-            return bool(self.api_key)
-        except ValueError:
-            return False
+        return self._enabled
+
+    async def startup(self) -> None:
+        """
+        Prepare the service for reuse by a long-lived process.
+
+        Unlike ``async with``, this leaves the executor running on return, so
+        Celery tasks can share one client and thread pool for the worker's
+        lifetime. Safe to call repeatedly; release with ``close()``.
+        """
+        if self._enabled:
+            await self._ensure_client()
 
     async def __aenter__(self):
         """Async context manager entry."""
-        await self._ensure_client()
+        if self._enabled:
+            await self._ensure_client()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -182,42 +204,41 @@ class FREDService:
     async def _ensure_client(self) -> None:
         """Ensure FRED client is available."""
         if self.fred_client is None:
+            if not self._enabled:
+                raise ValueError("FRED_API_KEY environment variable is required")
             try:
                 # Initialize fredapi client in thread pool to avoid blocking
-                self.fred_client = await asyncio.get_event_loop().run_in_executor(
-                    self.executor, lambda: Fred(api_key=self.api_key)
+                self.fred_client = await asyncio.get_running_loop().run_in_executor(
+                    self._get_executor(), functools.partial(Fred, api_key=self.api_key)
                 )
                 logger.info("FRED client initialized successfully")
             except Exception as e:
                 logger.error(f"Failed to initialize FRED client: {e}")
                 raise
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get thread pool executor, creating it on first use."""
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=4)
+        return self.executor
+
     async def close(self) -> None:
         """Close thread pool executor."""
         if self.executor:
             self.executor.shutdown(wait=True)
+            self.executor = None
 
     def _get_cache_key(self, endpoint: str, params: Dict[str, Any]) -> str:
         """Generate cache key for API request."""
         # Create deterministic hash from endpoint and params
         param_str = json.dumps(params, sort_keys=True)
         cache_input = f"{endpoint}:{param_str}"
-        return f"fred_api:{hashlib.md5(cache_input.encode()).hexdigest()}"
+        # v2: series payloads are stored as columnar orjson bytes
+        return f"fred_api:v2:{hashlib.md5(cache_input.encode()).hexdigest()}"
 
     def _determine_cache_ttl(self, series_id: str) -> int:
         """Determine appropriate cache TTL based on series frequency."""
-        # Weekly series get shorter cache
-        weekly_series = ['ICSA', 'CCSA', 'IC4WSA']
-        if series_id in weekly_series:
-            return self.WEEKLY_CACHE_TTL
-
-        # Monthly series get medium cache
-        monthly_series = ['HOUST', 'MSACSR', 'HSN1F', 'UNRATE', 'PAYEMS', 'CIVPART']
-        if series_id in monthly_series:
-            return self.MONTHLY_CACHE_TTL
-
-        # Default to daily cache
-        return self.DAILY_CACHE_TTL
+        return self._series_cache_ttls.get(series_id, self.DAILY_CACHE_TTL)
 
     def _pandas_series_to_datapoints(
         self, series: pd.Series, series_id: str
@@ -238,6 +259,16 @@ class FREDService:
 
         return data_points
 
+    def _get_series_sync(self, series_id: str, descending: bool, **kwargs) -> pd.Series:
+        """Fetch a series with fredapi and sort it; blocking, run in the executor."""
+        series_data = self.fred_client.get_series(series_id, **kwargs)
+
+        # Sort if needed
+        if descending:
+            series_data = series_data.sort_index(ascending=False)
+
+        return series_data
+
     async def _fetch_series_with_fredapi(
         self,
         series_id: str,
@@ -262,17 +293,12 @@ class FREDService:
             if await cache_service._ensure_connection():
                 cached_data = await cache_service.redis.get(cache_key)
                 if cached_data:
-                    if isinstance(cached_data, bytes):
-                        cached_data = cached_data.decode('utf-8')
-                    cached_points = json.loads(cached_data)
-                    logger.debug(f"Cache hit for FRED series: {series_id}")
+                    # Cached as columnar bytes: {'d': [dates], 'v': [values]}
+                    cached_points = orjson.loads(cached_data)
+                    logger.debug("Cache hit for FRED series: %s", series_id)
                     return [
-                        FREDDataPoint(
-                            date=point['date'],
-                            value=point['value'],
-                            realtime_start=point.get('realtime_start'),
-                            realtime_end=point.get('realtime_end')
-                        ) for point in cached_points
+                        FREDDataPoint(date=date, value=value)
+                        for date, value in zip(cached_points['d'], cached_points['v'])
                     ]
         except Exception as cache_error:
             logger.warning(f"Redis cache read failed: {cache_error}")
@@ -284,29 +310,20 @@ class FREDService:
         await self._ensure_client()
 
         try:
-            logger.debug(f"Fetching FRED series {series_id} with fredapi")
-
-            # Execute fredapi call in thread pool
-            def fetch_series():
-                kwargs = {}
-                if start_date:
-                    kwargs['observation_start'] = start_date
-                if end_date:
-                    kwargs['observation_end'] = end_date
-                if limit:
-                    kwargs['limit'] = limit
-
-                series_data = self.fred_client.get_series(series_id, **kwargs)
-
-                # Sort if needed
-                if sort_order == 'desc':
-                    series_data = series_data.sort_index(ascending=False)
-
-                return series_data
-
-            # Run in executor
-            series_data = await asyncio.get_event_loop().run_in_executor(
-                self.executor, fetch_series
+            logger.debug("Fetching FRED series %s with fredapi", series_id)
+
+            kwargs = {}
+            if start_date:
+                kwargs['observation_start'] = start_date
+            if end_date:
+                kwargs['observation_end'] = end_date
+            if limit:
+                kwargs['limit'] = limit
+
+            # Execute fredapi call (and sort) in thread pool
+            series_data = await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(),
+                functools.partial(self._get_series_sync, series_id, sort_order == 'desc', **kwargs)
             )
 
             # Convert to our format
@@ -316,24 +333,19 @@ class FREDService:
             cache_ttl = self._determine_cache_ttl(series_id)
             try:
                 if await cache_service._ensure_connection():
-                    cache_data = [
-                        {
-                            'date': point.date,
-                            'value': point.value,
-                            'realtime_start': point.realtime_start,
-                            'realtime_end': point.realtime_end
-                        } for point in data_points
-                    ]
-                    await cache_service.redis.setex(
-                        cache_key,
-                        cache_ttl,
-                        json.dumps(cache_data)
-                    )
+                    # orjson produces bytes directly, so no str -> utf-8 pivot
+                    cache_data = orjson.dumps({
+                        'd': [point.date for point in data_points],
+                        'v': [point.value for point in data_points]
+                    })
+                    await cache_service.redis.setex(cache_key, cache_ttl, cache_data)
             except Exception as cache_error:
                 logger.warning(f"Redis cache write failed: {cache_error}")
 
             logger.info(
-                f"Successfully retrieved {len(data_points)} observations for series: {series_id}")
+                "Successfully retrieved %d observations for series: %s",
+                len(data_points), series_id
+            )
             return data_points
 
         except Exception as e:
@@ -426,12 +438,8 @@ class FREDService:
             await self._ensure_client()
 
             # Execute fredapi call in thread pool
-            def fetch_info():
-                return self.fred_client.get_series_info(series_id)
-
-            # Run in executor
-            series_info = await asyncio.get_event_loop().run_in_executor(
-                self.executor, fetch_info
+            series_info = await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), self.fred_client.get_series_info, series_id
             )
 
             # Convert pandas Series to our format
@@ -477,24 +485,26 @@ class FREDService:
 
         logger.info("Fetching comprehensive housing market data from FRED...")
 
-        tasks = []
-        for series_name, series_id in self.HOUSING_SERIES.items():
-            task = self.fetch_series_data(
-                series_id=series_id,
-                start_date=start_date,
-                end_date=end_date,
-                limit=limit
-            )
-            tasks.append((series_name, task))
+        series_names = list(self.HOUSING_SERIES)
+        fetched = await asyncio.gather(
+            *(
+                self.fetch_series_data(
+                    series_id=series_id,
+                    start_date=start_date,
+                    end_date=end_date,
+                    limit=limit
+                )
+                for series_id in self.HOUSING_SERIES.values()
+            ),
+            return_exceptions=True
+        )
 
         results = {}
-        for series_name, task in tasks:
-            try:
-                data = await task
-                results[series_name] = data
-            except Exception as e:
-                logger.error(f"Error fetching housing series {series_name}: {e}")
-                results[series_name] = []
+        for series_name, data in zip(series_names, fetched):
+            if isinstance(data, Exception):
+                logger.error(f"Error fetching housing series {series_name}: {data}")
+                data = []
+            results[series_name] = data
 
         return results
 
@@ -521,24 +531,26 @@ class FREDService:
 
         logger.info("Fetching comprehensive labor market data from FRED...")
 
-        tasks = []
-        for series_name, series_id in self.EMPLOYMENT_SERIES.items():
-            task = self.fetch_series_data(
-                series_id=series_id,
-                start_date=start_date,
-                end_date=end_date,
-                limit=limit
-            )
-            tasks.append((series_name, task))
+        series_names = list(self.EMPLOYMENT_SERIES)
+        fetched = await asyncio.gather(
+            *(
+                self.fetch_series_data(
+                    series_id=series_id,
+                    start_date=start_date,
+                    end_date=end_date,
+                    limit=limit
+                )
+                for series_id in self.EMPLOYMENT_SERIES.values()
+            ),
+            return_exceptions=True
+        )
 
         results = {}
-        for series_name, task in tasks:
-            try:
-                data = await task
-                results[series_name] = data
-            except Exception as e:
-                logger.error(f"Error fetching labor series {series_name}: {e}")
-                results[series_name] = []
+        for series_name, data in zip(series_names, fetched):
+            if isinstance(data, Exception):
+                logger.error(f"Error fetching labor series {series_name}: {data}")
+                data = []
+            results[series_name] = data
 
         return results
 
@@ -559,7 +571,7 @@ class FREDService:
         Returns:
             Dictionary with update results
         """
-        from backend.models.database import EconomicSeries, EconomicDataPoint
+        from models.database import EconomicSeries, EconomicDataPoint
 
         # Calculate start date
         start_date = (datetime.utcnow() - timedelta(days=days_back)).strftime('%Y-%m-%d')
@@ -611,44 +623,63 @@ class FREDService:
                     session.add(db_series)
                     await session.flush()  # Get the ID
 
-                # Update series data points
-                for data_point in data_points:
-                    # Parse observation date
-                    obs_date = datetime.strptime(data_point.date, '%Y-%m-%d')
-
-                    # Check if data point already exists
-                    existing_stmt = select(EconomicDataPoint).where(
+                # Load the stored points for the fetched dates in one query
+                obs_dates = [
+                    datetime.strptime(data_point.date, '%Y-%m-%d')
+                    for data_point in data_points
+                ]
+                existing_result = await session.execute(
+                    select(
+                        EconomicDataPoint.id,
+                        EconomicDataPoint.observation_date,
+                        EconomicDataPoint.value
+                    ).where(
                         and_(
                             EconomicDataPoint.series_id == db_series.id,
-                            EconomicDataPoint.observation_date == obs_date
+                            EconomicDataPoint.observation_date.in_(obs_dates)
                         )
                     )
-                    existing_result = await session.execute(existing_stmt)
-                    existing_point = existing_result.scalar_one_or_none()
+                )
+                # Match on the UTC instant: the driver stores naive dates as
+                # local time, so a stored midnight isn't always a UTC midnight
+                existing_points = {
+                    row.observation_date.astimezone(timezone.utc): row
+                    for row in existing_result
+                }
 
+                new_rows = []
+                changed_rows = []
+                for data_point, obs_date in zip(data_points, obs_dates):
                     # Convert value to string (as stored in DB) and numeric
                     value_str = str(data_point.value) if data_point.value is not None else "."
                     numeric_value = int(data_point.value) if data_point.value is not None else None
 
+                    existing_point = existing_points.get(obs_date.astimezone(timezone.utc))
                     if existing_point:
                         # Update existing point if value changed
                         if existing_point.value != value_str:
-                            existing_point.value = value_str
-                            existing_point.numeric_value = numeric_value
-                            updated_count += 1
+                            changed_rows.append({
+                                'id': existing_point.id,
+                                'value': value_str,
+                                'numeric_value': numeric_value
+                            })
                         else:
                             skipped_count += 1
                     else:
-                        # Create new data point
-                        new_point = EconomicDataPoint(
-                            series_id=db_series.id,
-                            observation_date=obs_date,
-                            value=value_str,
-                            numeric_value=numeric_value,
-                            is_preliminary=False  # FRED data is usually final
-                        )
-                        session.add(new_point)
-                        updated_count += 1
+                        new_rows.append({
+                            'series_id': db_series.id,
+                            'observation_date': obs_date,
+                            'value': value_str,
+                            'numeric_value': numeric_value,
+                            'is_preliminary': False  # FRED data is usually final
+                        })
+
+                # Write all new and changed points as two executemany batches
+                if new_rows:
+                    await session.execute(insert(EconomicDataPoint), new_rows)
+                if changed_rows:
+                    await session.execute(update(EconomicDataPoint), changed_rows)
+                updated_count = len(new_rows) + len(changed_rows)
 
                 # Update series timestamp
                 db_series.updated_at = datetime.utcnow()
@@ -718,38 +749,43 @@ class FREDService:
 
         results = {'housing': {}, 'labor': {}}
 
-        for category, series_dict in key_series.items():
-            for indicator_name, series_id in series_dict.items():
-                try:
-                    data = await self.fetch_series_data(
-                        series_id=series_id,
-                        limit=1,
-                        sort_order='desc'
-                    )
-
-                    if data:
-                        latest_point = data[0]
-                        results[category][indicator_name] = {
-                            'value': latest_point.value,
-                            'date': latest_point.date,
-                            'series_id': series_id
-                        }
-                    else:
-                        results[category][indicator_name] = {
-                            'value': None,
-                            'date': None,
-                            'series_id': series_id,
-                            'error': 'No data available'
-                        }
-
-                except Exception as e:
-                    logger.error(f"Error fetching latest {indicator_name}: {e}")
-                    results[category][indicator_name] = {
-                        'value': None,
-                        'date': None,
-                        'series_id': series_id,
-                        'error': str(e)
-                    }
+        # Fetch all indicators in one concurrent batch rather than one by one
+        indicators = [
+            (category, indicator_name, series_id)
+            for category, series_dict in key_series.items()
+            for indicator_name, series_id in series_dict.items()
+        ]
+        fetched = await asyncio.gather(
+            *(
+                self.fetch_series_data(series_id=series_id, limit=1, sort_order='desc')
+                for _, _, series_id in indicators
+            ),
+            return_exceptions=True
+        )
+
+        for (category, indicator_name, series_id), data in zip(indicators, fetched):
+            if isinstance(data, Exception):
+                logger.error(f"Error fetching latest {indicator_name}: {data}")
+                results[category][indicator_name] = {
+                    'value': None,
+                    'date': None,
+                    'series_id': series_id,
+                    'error': str(data)
+                }
+            elif data:
+                latest_point = data[0]
+                results[category][indicator_name] = {
+                    'value': latest_point.value,
+                    'date': latest_point.date,
+                    'series_id': series_id
+                }
+            else:
+                results[category][indicator_name] = {
+                    'value': None,
+                    'date': None,
+                    'series_id': series_id,
+                    'error': 'No data available'
+                }
 
         return results
 
@@ -791,16 +827,43 @@ def get_fred_service() -> FREDService:
         _fred_service_instance = FREDService()
     return _fred_service_instance
 
+async def shutdown_fred_service() -> None:
+    """Release the global service's resources, if it was ever created."""
+    if _fred_service_instance is not None:
+        await _fred_service_instance.close()
+
 # Create a class that provides lazy access to the service
 
 class _FREDServiceProxy:
     """Proxy class for lazy FRED service initialization."""
 
+    __slots__ = ("_service",)
+
+    def __init__(self):
+        self._service: Optional[FREDService] = None
+
+    def _resolve(self) -> FREDService:
+        """Resolve the global service once and keep a direct reference."""
+        if self._service is None:
+            self._service = get_fred_service()
+        return self._service
+
     def __getattr__(self, name):
-        return getattr(get_fred_service(), name)
+        return getattr(self._resolve(), name)
 
     def __call__(self, *args, **kwargs):
-        return get_fred_service()(*args, **kwargs)
+        return self._resolve()(*args, **kwargs)
+
+    # Special methods bypass __getattr__, so `async with fred_service` needs these.
+    # The proxied service is process-wide: entering only starts it, and exiting
+    # leaves it open for other requests. shutdown_fred_service() releases it.
+    async def __aenter__(self):
+        service = self._resolve()
+        await service.startup()
+        return service
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
 
 # For backward compatibility - this won't initialize until actually used
 fred_service = _FREDServiceProxy()
@@ -3,38 +3,167 @@ Celery tasks for automated economic data updates from FRED API.
 """
 
 import asyncio
+import functools
 import logging
-from typing import Dict, List, Any
+import time
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 
 from celery import Task, current_task
+from celery.app.task import Context
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.celery_app import celery_app
+from core.celery_app import celery_app, run_async
+from core.config import settings
 from core.database import async_session_maker
-from services.fred_service import fred_service
+from services.fred_service import FREDService, fred_service
 from models.database import EconomicSeries, EconomicDataPoint
 
 logger = logging.getLogger(__name__)
 
+# Rows removed per transaction by cleanup_old_economic_data
+CLEANUP_BATCH_SIZE = 10000
+
+# (series name, FRED series ID) pairs, built once at import. Read from the
+# class so importing this module doesn't instantiate the FRED service.
+_HOUSING_ITEMS: Tuple[Tuple[str, str], ...] = tuple(FREDService.HOUSING_SERIES.items())
+_EMPLOYMENT_ITEMS: Tuple[Tuple[str, str], ...] = tuple(FREDService.EMPLOYMENT_SERIES.items())
+
 
 class EconomicDataTask(Task):
     """Custom task class for economic data processing with progress tracking."""
     
-    def update_progress(self, current: int, total: int, status: str = "processing"):
-        """Update task progress."""
+    # Minimum seconds between progress writes to the result backend
+    progress_interval = 0.5
+    
+    def update_progress(
+        self, current: int, total: int, status: str = "processing", request: Optional[Context] = None
+    ):
+        """
+        Update task progress.
+        
+        Intermediate updates are throttled to one per ``progress_interval``;
+        the final update (``current >= total``) is always written.
+        
+        ``self.request`` is thread-local, so code running on the shared worker
+        event loop must pass the request captured in the task body. The write
+        is a blocking backend call; don't call this on the event loop thread.
+        """
+        request = request or self.request
+        now = time.monotonic()
+        # The request is per-execution, so concurrent runs on the thread pool
+        # each keep their own throttle state
+        last_update = getattr(request, '_last_progress_ts', None)
+        if last_update is not None and current < total and now - last_update < self.progress_interval:
+            return
+        request._last_progress_ts = now
+        
         progress = int((current / total) * 100) if total > 0 else 0
-        self.update_state(
-            state='PROGRESS',
-            meta={
+        # Store through the backend with the captured request, since
+        # update_state() would read the (empty) thread-local self.request
+        self.backend.store_result(
+            request.id,
+            {
                 'current': current,
                 'total': total,
                 'status': status,
                 'progress': progress
-            }
+            },
+            'PROGRESS',
+            request=request
         )
 
 
+class _SeriesUpdateBatch:
+    """
+    Concurrent FRED series updates sharing one progress counter and one
+    concurrency limit of ``settings.FRED_MAX_CONCURRENCY``.
+    
+    Must be created inside the coroutine that uses it: asyncio primitives
+    bind to the event loop they first wait on.
+    """
+    
+    def __init__(self, task: EconomicDataTask, request: Context, total_series: int):
+        self.task = task
+        self.request = request
+        self.total_series = total_series
+        self.completed = 0
+        self.semaphore = asyncio.Semaphore(settings.FRED_MAX_CONCURRENCY)
+        # Keeps progress writes in completion order
+        self.progress_lock = asyncio.Lock()
+    
+    async def _update_one(
+        self, series_name: str, series_id: str, category: str, days_back: int
+    ) -> Dict[str, Any]:
+        try:
+            async with self.semaphore:
+                result = await fred_service.update_series_data(
+                    series_id=series_id,
+                    category=category,
+                    days_back=days_back
+                )
+            result = {
+                'series_name': series_name,
+                'series_id': series_id,
+                **result
+            }
+            
+        except Exception as e:
+            logger.error(f"Error updating {category} series {series_name}: {e}")
+            result = {
+                'series_name': series_name,
+                'series_id': series_id,
+                'error': str(e),
+                'updated_count': 0,
+                'skipped_count': 0
+            }
+        
+        self.completed += 1
+        completed = self.completed
+        # The progress write is a blocking Redis call; keep it off the event loop
+        async with self.progress_lock:
+            await asyncio.get_running_loop().run_in_executor(None, functools.partial(
+                self.task.update_progress,
+                completed, self.total_series, f"Updated {series_name} ({series_id})",
+                request=self.request
+            ))
+        return result
+    
+    async def run(
+        self, series: Tuple[Tuple[str, str], ...], category: str, days_back: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Update a group of FRED series concurrently.
+        
+        Args:
+            series: (series name, FRED series ID) pairs
+            category: Category of series ('housing' or 'labor_market')
+            days_back: Number of days back to fetch data
+            
+        Returns:
+            List of per-series update results, in the order of ``series``
+        """
+        return await asyncio.gather(*(
+            self._update_one(series_name, series_id, category, days_back)
+            for series_name, series_id in series
+        ))
+
+
+def _summarize_series_results(
+    task_type: str, results: List[Dict[str, Any]], completed_at: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build the task result for a group of series updates."""
+    return {
+        'status': 'success',
+        'task_type': task_type,
+        'total_updated': sum(r.get('updated_count', 0) for r in results),
+        'total_skipped': sum(r.get('skipped_count', 0) for r in results),
+        'total_errors': sum(1 for r in results if 'error' in r),
+        'series_results': results,
+        'completed_at': completed_at or datetime.utcnow().isoformat()
+    }
+
+
 @celery_app.task(bind=True, base=EconomicDataTask, name="update_housing_market_data")
 def update_housing_market_data(self, days_back: int = 7) -> Dict[str, Any]:
     """
@@ -49,71 +178,22 @@ def update_housing_market_data(self, days_back: int = 7) -> Dict[str, Any]:
     try:
         logger.info(f"Starting housing market data update (last {days_back} days)")
         
-        # Run async operation in event loop
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        # self.request is thread-local; capture it for progress updates
+        request = self.request
+        
+        # Run async operation on the worker's shared event loop
+        async def update_housing_data():
+            await fred_service.startup()
+            batch = _SeriesUpdateBatch(self, request, len(_HOUSING_ITEMS))
+            return await batch.run(_HOUSING_ITEMS, "housing", days_back)
+        
+        results = run_async(update_housing_data())
+        summary = _summarize_series_results('housing_market_update', results)
+        
+        logger.info(f"Housing market data update completed: {summary['total_updated']} updated, {summary['total_skipped']} skipped, {summary['total_errors']} errors")
+        
+        return summary
         
-        try:
-            async def update_housing_data():
-                async with fred_service:
-                    housing_series = fred_service.HOUSING_SERIES
-                    total_series = len(housing_series)
-                    
-                    results = []
-                    
-                    for i, (series_name, series_id) in enumerate(housing_series.items()):
-                        self.update_progress(
-                            i + 1, 
-                            total_series, 
-                            f"Updating {series_name} ({series_id})"
-                        )
-                        
-                        try:
-                            result = await fred_service.update_series_data(
-                                series_id=series_id,
-                                category="housing",
-                                days_back=days_back
-                            )
-                            results.append({
-                                'series_name': series_name,
-                                'series_id': series_id,
-                                **result
-                            })
-                            
-                        except Exception as e:
-                            logger.error(f"Error updating housing series {series_name}: {e}")
-                            results.append({
-                                'series_name': series_name,
-                                'series_id': series_id,
-                                'error': str(e),
-                                'updated_count': 0,
-                                'skipped_count': 0
-                            })
-                    
-                    return results
-            
-            results = loop.run_until_complete(update_housing_data())
-            
-            # Calculate summary statistics
-            total_updated = sum(r.get('updated_count', 0) for r in results)
-            total_skipped = sum(r.get('skipped_count', 0) for r in results)
-            total_errors = sum(1 for r in results if 'error' in r)
-            
-            logger.info(f"Housing market data update completed: {total_updated} updated, {total_skipped} skipped, {total_errors} errors")
-            
-            return {
-                'status': 'success',
-                'task_type': 'housing_market_update',
-                'total_updated': total_updated,
-                'total_skipped': total_skipped,
-                'total_errors': total_errors,
-                'series_results': results,
-                'completed_at': datetime.utcnow().isoformat()
-            }
-            
-        finally:
-            loop.close()
-            
     except Exception as e:
         logger.error(f"Error in housing market data update: {e}")
         raise Exception(f"Housing market data update failed: {str(e)}")
@@ -133,71 +213,22 @@ def update_labor_market_data(self, days_back: int = 7) -> Dict[str, Any]:
     try:
         logger.info(f"Starting labor market data update (last {days_back} days)")
         
-        # Run async operation in event loop
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        # self.request is thread-local; capture it for progress updates
+        request = self.request
+        
+        # Run async operation on the worker's shared event loop
+        async def update_labor_data():
+            await fred_service.startup()
+            batch = _SeriesUpdateBatch(self, request, len(_EMPLOYMENT_ITEMS))
+            return await batch.run(_EMPLOYMENT_ITEMS, "labor_market", days_back)
+        
+        results = run_async(update_labor_data())
+        summary = _summarize_series_results('labor_market_update', results)
+        
+        logger.info(f"Labor market data update completed: {summary['total_updated']} updated, {summary['total_skipped']} skipped, {summary['total_errors']} errors")
+        
+        return summary
         
-        try:
-            async def update_labor_data():
-                async with fred_service:
-                    employment_series = fred_service.EMPLOYMENT_SERIES
-                    total_series = len(employment_series)
-                    
-                    results = []
-                    
-                    for i, (series_name, series_id) in enumerate(employment_series.items()):
-                        self.update_progress(
-                            i + 1, 
-                            total_series, 
-                            f"Updating {series_name} ({series_id})"
-                        )
-                        
-                        try:
-                            result = await fred_service.update_series_data(
-                                series_id=series_id,
-                                category="labor_market",
-                                days_back=days_back
-                            )
-                            results.append({
-                                'series_name': series_name,
-                                'series_id': series_id,
-                                **result
-                            })
-                            
-                        except Exception as e:
-                            logger.error(f"Error updating labor series {series_name}: {e}")
-                            results.append({
-                                'series_name': series_name,
-                                'series_id': series_id,
-                                'error': str(e),
-                                'updated_count': 0,
-                                'skipped_count': 0
-                            })
-                    
-                    return results
-            
-            results = loop.run_until_complete(update_labor_data())
-            
-            # Calculate summary statistics
-            total_updated = sum(r.get('updated_count', 0) for r in results)
-            total_skipped = sum(r.get('skipped_count', 0) for r in results)
-            total_errors = sum(1 for r in results if 'error' in r)
-            
-            logger.info(f"Labor market data update completed: {total_updated} updated, {total_skipped} skipped, {total_errors} errors")
-            
-            return {
-                'status': 'success',
-                'task_type': 'labor_market_update',
-                'total_updated': total_updated,
-                'total_skipped': total_skipped,
-                'total_errors': total_errors,
-                'series_results': results,
-                'completed_at': datetime.utcnow().isoformat()
-            }
-            
-        finally:
-            loop.close()
-            
     except Exception as e:
         logger.error(f"Error in labor market data update: {e}")
         raise Exception(f"Labor market data update failed: {str(e)}")
@@ -208,6 +239,10 @@ def update_all_economic_data(self, days_back: int = 7) -> Dict[str, Any]:
     """
     Update all economic data (housing and labor market).
     
+    Both groups are updated concurrently in this task, sharing one FRED
+    service context and rate limiter, instead of dispatching and blocking
+    on the housing and labor subtasks.
+    
     Args:
         days_back: Number of days back to fetch data
         
@@ -217,24 +252,27 @@ def update_all_economic_data(self, days_back: int = 7) -> Dict[str, Any]:
     try:
         logger.info(f"Starting comprehensive economic data update (last {days_back} days)")
         
-        self.update_progress(1, 3, "Updating housing market data")
-        housing_result = update_housing_market_data.apply_async(
-            args=[days_back],
-            queue='economic_data'
-        ).get()
+        # self.request is thread-local; capture it for progress updates
+        request = self.request
         
-        self.update_progress(2, 3, "Updating labor market data")
-        labor_result = update_labor_market_data.apply_async(
-            args=[days_back],
-            queue='economic_data'
-        ).get()
+        # Run async operation on the worker's shared event loop
+        async def update_all_data():
+            await fred_service.startup()
+            batch = _SeriesUpdateBatch(self, request, len(_HOUSING_ITEMS) + len(_EMPLOYMENT_ITEMS))
+            return await asyncio.gather(
+                batch.run(_HOUSING_ITEMS, "housing", days_back),
+                batch.run(_EMPLOYMENT_ITEMS, "labor_market", days_back)
+            )
         
-        self.update_progress(3, 3, "Completed")
+        housing_results, labor_results = run_async(update_all_data())
+        completed_at = datetime.utcnow().isoformat()
+        housing_result = _summarize_series_results('housing_market_update', housing_results, completed_at)
+        labor_result = _summarize_series_results('labor_market_update', labor_results, completed_at)
         
         # Combine results
-        total_updated = housing_result.get('total_updated', 0) + labor_result.get('total_updated', 0)
-        total_skipped = housing_result.get('total_skipped', 0) + labor_result.get('total_skipped', 0)
-        total_errors = housing_result.get('total_errors', 0) + labor_result.get('total_errors', 0)
+        total_updated = housing_result['total_updated'] + labor_result['total_updated']
+        total_skipped = housing_result['total_skipped'] + labor_result['total_skipped']
+        total_errors = housing_result['total_errors'] + labor_result['total_errors']
         
         logger.info(f"Complete economic data update finished: {total_updated} updated, {total_skipped} skipped, {total_errors} errors")
         
@@ -246,7 +284,7 @@ def update_all_economic_data(self, days_back: int = 7) -> Dict[str, Any]:
             'total_errors': total_errors,
             'housing_result': housing_result,
             'labor_result': labor_result,
-            'completed_at': datetime.utcnow().isoformat()
+            'completed_at': completed_at
         }
         
     except Exception as e:
@@ -265,35 +303,28 @@ def fetch_latest_indicators(self) -> Dict[str, Any]:
     try:
         logger.info("Fetching latest economic indicators")
         
-        # Run async operation in event loop
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        # Run async operation on the worker's shared event loop
+        async def get_latest():
+            await fred_service.startup()
+            return await fred_service.get_latest_indicators()
+        
+        indicators = run_async(get_latest())
+        
+        logger.info("Successfully fetched latest economic indicators")
+        
+        return {
+            'status': 'success',
+            'task_type': 'latest_indicators',
+            'indicators': indicators,
+            'fetched_at': datetime.utcnow().isoformat()
+        }
         
-        try:
-            async def get_latest():
-                async with fred_service:
-                    return await fred_service.get_latest_indicators()
-            
-            indicators = loop.run_until_complete(get_latest())
-            
-            logger.info("Successfully fetched latest economic indicators")
-            
-            return {
-                'status': 'success',
-                'task_type': 'latest_indicators',
-                'indicators': indicators,
-                'fetched_at': datetime.utcnow().isoformat()
-            }
-            
-        finally:
-            loop.close()
-            
     except Exception as e:
         logger.error(f"Error fetching latest indicators: {e}")
         raise Exception(f"Latest indicators fetch failed: {str(e)}")
 
 
-@celery_app.task(bind=True, base=EconomicDataTask, name="validate_economic_data")
+@celery_app.task(bind=True, base=EconomicDataTask, name="validate_economic_data", ignore_result=True)
 def validate_economic_data(self) -> Dict[str, Any]:
     """
     Validate economic data integrity and check for missing data.
@@ -304,87 +335,83 @@ def validate_economic_data(self) -> Dict[str, Any]:
     try:
         logger.info("Starting economic data validation")
         
-        # Run async operation in event loop
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        try:
-            async def validate_data():
-                from sqlalchemy import select, func, and_
+        # Run async operation on the worker's shared event loop
+        async def validate_data():
+            from sqlalchemy import select, func, and_
+            
+            validation_results = {
+                'total_series': 0,
+                'total_data_points': 0,
+                'series_with_recent_data': 0,
+                'series_missing_recent_data': [],
+                'data_gaps': [],
+                'validation_errors': []
+            }
+            
+            async with async_session_maker() as session:
+                # Count total series and data points in one round-trip
+                totals_result = await session.execute(
+                    select(
+                        select(func.count(EconomicSeries.id)).scalar_subquery(),
+                        select(func.count(EconomicDataPoint.id)).scalar_subquery()
+                    )
+                )
+                (
+                    validation_results['total_series'],
+                    validation_results['total_data_points']
+                ) = totals_result.one()
                 
-                validation_results = {
-                    'total_series': 0,
-                    'total_data_points': 0,
-                    'series_with_recent_data': 0,
-                    'series_missing_recent_data': [],
-                    'data_gaps': [],
-                    'validation_errors': []
-                }
+                # Check for series with recent data (within last 60 days)
+                recent_cutoff = datetime.utcnow() - timedelta(days=60)
                 
-                async with async_session_maker() as session:
-                    # Count total series
-                    total_series_result = await session.execute(
-                        select(func.count(EconomicSeries.id))
+                # Flag every series with an EXISTS probe, which can stop at
+                # the first recent point via idx_economic_data_series_date
+                has_recent = select(EconomicDataPoint.id).where(
+                    and_(
+                        EconomicDataPoint.series_id == EconomicSeries.id,
+                        EconomicDataPoint.observation_date >= recent_cutoff
                     )
-                    validation_results['total_series'] = total_series_result.scalar()
-                    
-                    # Count total data points
-                    total_points_result = await session.execute(
-                        select(func.count(EconomicDataPoint.id))
+                ).exists()
+                series_result = await session.execute(
+                    select(
+                        EconomicSeries.series_id,
+                        EconomicSeries.name,
+                        EconomicSeries.category,
+                        EconomicSeries.updated_at,
+                        has_recent.label('has_recent')
                     )
-                    validation_results['total_data_points'] = total_points_result.scalar()
-                    
-                    # Check for series with recent data (within last 60 days)
-                    recent_cutoff = datetime.utcnow() - timedelta(days=60)
-                    
-                    # Get all series
-                    series_result = await session.execute(select(EconomicSeries))
-                    all_series = series_result.scalars().all()
-                    
-                    for series in all_series:
-                        # Check for recent data
-                        recent_data_result = await session.execute(
-                            select(func.count(EconomicDataPoint.id)).where(
-                                and_(
-                                    EconomicDataPoint.series_id == series.id,
-                                    EconomicDataPoint.observation_date >= recent_cutoff
-                                )
-                            )
-                        )
-                        recent_count = recent_data_result.scalar()
-                        
-                        if recent_count > 0:
-                            validation_results['series_with_recent_data'] += 1
-                        else:
-                            validation_results['series_missing_recent_data'].append({
-                                'series_id': series.series_id,
-                                'name': series.name,
-                                'category': series.category,
-                                'last_updated': series.updated_at.isoformat() if series.updated_at else None
-                            })
+                )
                 
-                return validation_results
-            
-            results = loop.run_until_complete(validate_data())
-            
-            logger.info(f"Economic data validation completed: {results['total_series']} series, {results['total_data_points']} data points")
-            
-            return {
-                'status': 'success',
-                'task_type': 'data_validation',
-                'validation_results': results,
-                'validated_at': datetime.utcnow().isoformat()
-            }
-            
-        finally:
-            loop.close()
+                for series in series_result:
+                    if series.has_recent:
+                        validation_results['series_with_recent_data'] += 1
+                    else:
+                        validation_results['series_missing_recent_data'].append({
+                            'series_id': series.series_id,
+                            'name': series.name,
+                            'category': series.category,
+                            'last_updated': series.updated_at.isoformat() if series.updated_at else None
+                        })
             
+            return validation_results
+        
+        results = run_async(validate_data())
+        
+        logger.info(f"Economic data validation completed: {results['total_series']} series, {results['total_data_points']} data points")
+        
+        return {
+            'status': 'success',
+            'task_type': 'data_validation',
+            'validation_results': results,
+            'validated_at': datetime.utcnow().isoformat()
+        }
+        
     except Exception as e:
         logger.error(f"Error in data validation: {e}")
         raise Exception(f"Data validation failed: {str(e)}")
 
 
-@celery_app.task(name="cleanup_old_economic_data")
+@celery_app.task(name="cleanup_old_economic_data", ignore_result=True)
 def cleanup_old_economic_data(days_to_keep: int = 365) -> Dict[str, Any]:
     """
     Clean up old economic data points to manage database size.
@@ -398,44 +425,48 @@ def cleanup_old_economic_data(days_to_keep: int = 365) -> Dict[str, Any]:
     try:
         logger.info(f"Starting cleanup of economic data older than {days_to_keep} days")
         
-        # Run async operation in event loop
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
         
-        try:
-            async def cleanup_data():
-                from sqlalchemy import delete
-                
-                cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
-                
-                async with async_session_maker() as session:
-                    # Delete old data points
-                    delete_stmt = delete(EconomicDataPoint).where(
-                        EconomicDataPoint.observation_date < cutoff_date.date()
-                    )
-                    
+        # Run async operation on the worker's shared event loop
+        async def cleanup_data():
+            from sqlalchemy import delete, select
+            
+            # Delete in bounded batches, committing each one, so row locks
+            # and WAL growth stay small and ingest tasks can keep writing
+            expired_ids = (
+                select(EconomicDataPoint.id)
+                .where(EconomicDataPoint.observation_date < cutoff_date.date())
+                .limit(CLEANUP_BATCH_SIZE)
+            )
+            delete_stmt = delete(EconomicDataPoint).where(
+                EconomicDataPoint.id.in_(expired_ids)
+            )
+            
+            deleted_count = 0
+            async with async_session_maker() as session:
+                while True:
                     result = await session.execute(delete_stmt)
-                    deleted_count = result.rowcount
-                    
                     await session.commit()
                     
-                    return deleted_count
-            
-            deleted_count = loop.run_until_complete(cleanup_data())
-            
-            logger.info(f"Economic data cleanup completed: {deleted_count} old records deleted")
-            
-            return {
-                'status': 'success',
-                'task_type': 'data_cleanup',
-                'deleted_count': deleted_count,
-                'cutoff_date': (datetime.utcnow() - timedelta(days=days_to_keep)).isoformat(),
-                'completed_at': datetime.utcnow().isoformat()
-            }
-            
-        finally:
-            loop.close()
-            
+                    batch_count = result.rowcount
+                    deleted_count += batch_count
+                    if batch_count < CLEANUP_BATCH_SIZE:
+                        break
+                
+                return deleted_count
+        
+        deleted_count = run_async(cleanup_data())
+        
+        logger.info(f"Economic data cleanup completed: {deleted_count} old records deleted")
+        
+        return {
+            'status': 'success',
+            'task_type': 'data_cleanup',
+            'deleted_count': deleted_count,
+            'cutoff_date': cutoff_date.isoformat(),
+            'completed_at': datetime.utcnow().isoformat()
+        }
+        
     except Exception as e:
         logger.error(f"Error in data cleanup: {e}")
         raise Exception(f"Data cleanup failed: {str(e)}")
@@ -0,0 +1,60 @@
+"""
+Celery Worker Event Loop Tests
+Tests the shared worker event loop that economic tasks submit their coroutines to.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import celery_app as celery_module
+from core.celery_app import run_async
+
+
+@pytest.fixture(autouse=True)
+def shutdown_worker_loop():
+    """Stop the shared loop after each test so tests don't share its thread."""
+    yield
+    celery_module._shutdown_worker_loop()
+
+
+def test_run_async_returns_result_from_loop_thread():
+    """Coroutines run on the shared loop thread, and one loop serves every call."""
+    async def current_thread():
+        return threading.current_thread()
+
+    first_thread = run_async(current_thread())
+    second_thread = run_async(current_thread())
+
+    assert first_thread is not threading.current_thread()
+    assert first_thread is second_thread
+
+
+def test_run_async_cancels_coroutine_on_timeout():
+    """A timed-out coroutine is cancelled on the loop instead of left running."""
+    cancelled = threading.Event()
+
+    async def never_finishes():
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(FutureTimeoutError):
+        run_async(never_finishes(), timeout=0.05)
+
+    assert cancelled.wait(timeout=1)
+
+
+def test_shutdown_skips_loop_that_was_never_started():
+    """Shutting down without any task having run doesn't start a loop."""
+    celery_module._shutdown_worker_loop()
+
+    assert celery_module._worker_loop is None
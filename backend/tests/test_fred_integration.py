@@ -417,9 +417,10 @@ class FREDIntegrationTester:
             
             # Test 4: Service disabled handling
             try:
-                # Create a disabled service instance
-                disabled_service = FREDService()
-                disabled_service.api_key = None  # Force disable
+                # Create a disabled service instance (enabled state is read at init)
+                with patch.dict(os.environ):
+                    os.environ.pop('FRED_API_KEY', None)
+                    disabled_service = FREDService()
                 
                 disabled_data = await disabled_service.fetch_series_data('UNRATE')
                 disabled_info = await disabled_service.fetch_series_info('UNRATE')
@@ -0,0 +1,135 @@
+"""
+FRED Service Unit Tests
+Tests rate limiting and database update logic with fredapi, Redis and the database stubbed out.
+"""
+
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.fred_service import FREDDataPoint, FREDRateLimiter, FREDService
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_records_request_under_limit():
+    """A request under the limit is recorded without waiting for the window."""
+    limiter = FREDRateLimiter(max_requests=2, time_window=10)
+
+    with patch('services.fred_service.time.monotonic', return_value=100.0), \
+            patch('services.fred_service.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+        await limiter.acquire()
+
+    assert list(limiter.requests) == [100.0]
+    # Only the minimum delay between requests
+    mock_sleep.assert_awaited_once_with(0.5)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_waits_for_window_then_records():
+    """At the limit, the limiter sleeps until the oldest request expires, then records."""
+    limiter = FREDRateLimiter(max_requests=2, time_window=10)
+    limiter.requests.extend([0.0, 1.0])
+
+    # First check at t=5 is over the limit; the re-check after sleeping is at t=10.5
+    with patch('services.fred_service.time.monotonic', side_effect=[5.0, 10.5]), \
+            patch('services.fred_service.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+        await limiter.acquire()
+
+    assert [call.args[0] for call in mock_sleep.await_args_list] == [5.0, 0.5]
+    # The expired request is dropped and the new one recorded at the re-check time
+    assert list(limiter.requests) == [1.0, 10.5]
+
+
+class _FakeSession:
+    """Async session stub that returns queued results and records executed statements."""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.executed = []
+        self.committed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    async def execute(self, statement, params=None):
+        self.executed.append((statement, params))
+        return self.results.pop(0) if self.results else None
+
+    async def commit(self):
+        self.committed = True
+
+
+@pytest.fixture
+def worker_timezone(request):
+    """Run the test with the process timezone set to ``request.param``."""
+    original_tz = os.environ.get('TZ')
+    os.environ['TZ'] = request.param
+    time.tzset()
+    yield request.param
+    if original_tz is None:
+        os.environ.pop('TZ', None)
+    else:
+        os.environ['TZ'] = original_tz
+    time.tzset()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('worker_timezone', ['UTC', 'Europe/Paris'], indirect=True)
+async def test_update_series_data_splits_new_changed_and_unchanged_points(worker_timezone):
+    """New points are bulk inserted, changed values bulk updated, unchanged values skipped."""
+    db_series = SimpleNamespace(id=uuid.uuid4(), updated_at=None)
+    changed_id = uuid.uuid4()
+
+    series_result = MagicMock()
+    series_result.scalar_one_or_none.return_value = db_series
+    # asyncpg stores naive datetimes as local time and returns them as UTC-aware
+    # values, so east of UTC a stored midnight comes back on the previous day
+    existing_rows = [
+        SimpleNamespace(id=changed_id, observation_date=datetime(2024, 2, 1).astimezone(timezone.utc), value="3.0"),
+        SimpleNamespace(id=uuid.uuid4(), observation_date=datetime(2024, 1, 1).astimezone(timezone.utc), value="3.0"),
+    ]
+    session = _FakeSession([series_result, existing_rows])
+
+    fetched_points = [
+        FREDDataPoint(date='2024-03-01', value=5.0),  # new
+        FREDDataPoint(date='2024-02-01', value=4.0),  # changed
+        FREDDataPoint(date='2024-01-01', value=3.0),  # unchanged
+    ]
+
+    with patch.dict(os.environ, {'FRED_API_KEY': 'test-key'}):
+        service = FREDService()
+
+    with patch.object(service, 'fetch_series_data', AsyncMock(return_value=fetched_points)), \
+            patch.object(service, 'fetch_series_info', AsyncMock(side_effect=Exception("offline"))), \
+            patch('services.fred_service.async_session_maker', return_value=session):
+        result = await service.update_series_data('UNRATE', 'labor_market', days_back=90)
+
+    assert result['updated_count'] == 2
+    assert result['skipped_count'] == 1
+    assert 'error' not in result
+    assert session.committed
+
+    writes = {
+        ('insert' if statement.is_insert else 'update'): params
+        for statement, params in session.executed[2:]
+    }
+    assert len(session.executed) == 4
+    assert writes['insert'] == [{
+        'series_id': db_series.id,
+        'observation_date': datetime(2024, 3, 1),
+        'value': '5.0',
+        'numeric_value': 5,
+        'is_preliminary': False
+    }]
+    assert writes['update'] == [{'id': changed_id, 'value': '4.0', 'numeric_value': 4}]